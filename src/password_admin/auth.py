@@ -1,4 +1,5 @@
 import re
+import string
 from typing import Annotated
 
 from pydantic import BaseModel
@@ -7,29 +8,51 @@ from pydantic import StringConstraints
 
 from password_admin.settings import settings
 
+_LETTER = 'L'
+_DIGIT = 'D'
+_SPECIAL = 'S'
+_CHARACTER_CLASSES = str.maketrans(
+    dict.fromkeys(string.ascii_letters, _LETTER) | dict.fromkeys(string.digits, _DIGIT) | dict.fromkeys('!@#$%^&*(),.?":{}|<>', _SPECIAL),
+)
+_RE_LETTER = re.compile(r'[A-Za-z]')
+_RE_DIGIT = re.compile(r'\d')
+_RE_SPECIAL = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+
+
+def _has_character_classes(value: str) -> tuple[bool, bool, bool]:
+    # translate is only fast for ASCII strings, other input goes through the regexes
+    if value.isascii():
+        classes = set(value.translate(_CHARACTER_CLASSES))
+        return _LETTER in classes, _DIGIT in classes, _SPECIAL in classes
+    return _RE_LETTER.search(value) is not None, _RE_DIGIT.search(value) is not None, _RE_SPECIAL.search(value) is not None
+
+
+_Username = Annotated[str, StringConstraints(min_length=1, max_length=settings.max_username_length, pattern=f'^[{settings.username_allowed_characters}]+$')]
+
 
 class LoginCredentials(BaseModel):
     """Credentials used for logging in."""
 
-    username: Annotated[str, StringConstraints(min_length=1, max_length=settings.max_username_length, pattern=f'^[{settings.username_allowed_characters}]+$')]
+    username: _Username
     password: Annotated[str, StringConstraints(max_length=settings.max_password_length)]
 
 
 class NewCredentials(BaseModel):
     """Credentials used when setting a new password."""
 
-    username: Annotated[str, StringConstraints(min_length=1, max_length=settings.max_username_length, pattern=f'^[{settings.username_allowed_characters}]+$')]
+    username: _Username
     password: Annotated[str, StringConstraints(min_length=settings.min_password_length, max_length=settings.max_password_length)]
 
     @field_validator('password')
     @classmethod
     def validate_password(cls, value: str) -> str:
+        has_letter, has_digit, has_special = _has_character_classes(value)
         msg = None
-        if not re.search(r'[A-Za-z]', value):
+        if not has_letter:
             msg = 'Password must contain at least one letter'
-        if not re.search(r'\d', value):
+        if not has_digit:
             msg = 'Password must contain at least one number'
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', value):
+        if not has_special:
             msg = 'Password must contain at least one special character'
         if msg:
             raise ValueError(msg)
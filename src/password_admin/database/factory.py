@@ -5,6 +5,8 @@ from password_admin.database.interface import DbConnectionInterface
 class DbConnectionFactory:
     """DatabaseFactory stub."""
 
+    __slots__ = ('__config',)
+
     def __init__(self, config: DbConfig):
         self.__config = config
 
@@ -2,6 +2,8 @@ from typing import Annotated
 from typing import Literal
 
 from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
 from pydantic import PositiveInt
 from pydantic import StringConstraints
 from pydantic_settings import BaseSettings
@@ -11,6 +13,8 @@ from pydantic_settings import SettingsConfigDict
 class SessionConfig(BaseModel):
     """Settings related to sessions."""
 
+    model_config = ConfigDict(frozen=True)
+
     id_length: PositiveInt = 64
     duration_seconds: PositiveInt = 900
     max_amount: PositiveInt = 1024
@@ -19,10 +23,10 @@ class SessionConfig(BaseModel):
 class Settings(BaseSettings):
     """Application settings."""
 
-    model_config = SettingsConfigDict(env_nested_delimiter='__')
+    model_config = SettingsConfigDict(env_nested_delimiter='__', frozen=True)
 
     database_type: Literal['postgres', 'ldap'] = 'postgres'
-    session: SessionConfig = SessionConfig()
+    session: SessionConfig = Field(default_factory=SessionConfig)
     max_username_length: PositiveInt = 256
     username_allowed_characters: Annotated[str, StringConstraints(min_length=1)] = 'a-zA-Z0-9_.-@'
     min_password_length: PositiveInt = 16
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
+
+from pydantic import Field
 
 from password_admin.auth import LoginCredentials
 from password_admin.auth import NewCredentials
@@ -8,7 +10,8 @@ from password_admin.exceptions import DbLoginError
 from password_admin.exceptions import DbQueryError
 
 
-class DummyDbMemory(BaseModel):
+@dataclass(slots=True)
+class DummyDbMemory:
     """Storage to read information from dummy db operations."""
 
     object_created: bool = False
@@ -31,7 +34,7 @@ class DummyDbConfig(DbConfig):
     get_users_query_problem: bool = False
     set_password_connection_problem: bool = False
     set_password_query_problem: bool = False
-    memory: DummyDbMemory = DummyDbMemory()
+    memory: DummyDbMemory = Field(default_factory=DummyDbMemory)
 
 
 class DummyDbConnection:
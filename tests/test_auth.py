@@ -0,0 +1,48 @@
+from pydantic import ValidationError
+import pytest
+
+from password_admin.auth import LoginCredentials
+from password_admin.auth import NewCredentials
+
+
+@pytest.mark.parametrize('password', ['Password1234567!', 'Pąssword1234567!', 'Password' + '\u0661' * 8 + '!'])
+def test_new_credentials_with_valid_password_created(password: str) -> None:
+    """Password with letter, number and special character is accepted."""
+    credentials = NewCredentials(username='user', password=password)
+    assert credentials.password
+
+
+@pytest.mark.parametrize(
+    'password,message',
+    [
+        ('1234567890123456!', 'at least one letter'),
+        ('Passwordpassword!', 'at least one number'),
+        ('Pąsswordpassword!', 'at least one number'),
+        ('Pąssword12345678', 'at least one special character'),
+        ('Password12345678', 'at least one special character'),
+    ],
+)
+def test_new_credentials_with_missing_character_class_raises(password: str, message: str) -> None:
+    """Password missing a required character class is rejected."""
+    with pytest.raises(ValidationError, match=message):
+        NewCredentials(username='user', password=password)
+
+
+def test_new_credentials_with_unlisted_special_character_raises() -> None:
+    """Characters outside the special character list do not count as special."""
+    with pytest.raises(ValidationError, match='at least one special character'):
+        NewCredentials(username='user', password='Pąssword12345678 ')
+
+
+@pytest.mark.parametrize('username', ['user', 'user.name@example.com', 'user_1.2'])
+def test_login_credentials_with_valid_username_created(username: str) -> None:
+    """Username built from allowed characters is accepted."""
+    credentials = LoginCredentials(username=username, password='pass')
+    assert credentials.username == username
+
+
+@pytest.mark.parametrize('username', ['user name', 'user\n', 'użytkownik', ''])
+def test_login_credentials_with_invalid_username_raises(username: str) -> None:
+    """Username with not allowed characters or empty is rejected."""
+    with pytest.raises(ValidationError):
+        LoginCredentials(username=username, password='pass')
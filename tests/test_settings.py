@@ -0,0 +1,21 @@
+from pydantic import ValidationError
+import pytest
+
+from password_admin.settings import settings
+
+
+def test_assign_to_settings_raises() -> None:
+    """Assigning to loaded settings raises."""
+    with pytest.raises(ValidationError, match='frozen'):
+        settings.min_password_length = 1  # type: ignore[misc]
+
+
+def test_assign_to_session_settings_raises() -> None:
+    """Assigning to loaded session settings raises."""
+    with pytest.raises(ValidationError, match='frozen'):
+        settings.session.max_amount = 1  # type: ignore[misc]
+
+
+def test_hash_settings_does_not_raise() -> None:
+    """Loaded settings are hashable."""
+    assert isinstance(hash(settings), int)